@@ -3,7 +3,26 @@ Military Training Camp Management System - Solution version for demonstrating en
 """
 
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import defaultdict, deque
+from datetime import date
+from itertools import count
+
+__all__ = (
+    "AccessDeniedException", "InvalidDataException",
+    "MilitaryPersonnel", "Officer", "Recruit",
+    "TrainingProgram", "EquipmentInventory", "CampManagementSystem",
+)
+
+
+# Ranks accepted by the MilitaryPersonnel.rank setter
+_VALID_RANKS = frozenset({"Private", "Corporal", "Sergeant", "Lieutenant", "Captain", "Major", "Colonel", "General"})
+
+# Prefix for the private Officer command code
+_CMD_PREFIX = "CMD-"
+
+# Cached (day ordinal, "YYYY-MM-DD") pair used by _today_str
+_today_cache = (None, None)
+_today = date.today
 
 
 class AccessDeniedException(Exception):
@@ -16,10 +35,42 @@ class InvalidDataException(Exception):
     pass
 
 
+def _today_str():
+    """Return today's local date as "YYYY-MM-DD", formatting it once per day."""
+    global _today_cache
+    today = _today()
+    ordinal = today.toordinal()
+    cached = _today_cache
+    if cached[0] != ordinal:
+        # Swap in the new pair with one assignment so readers never see a mixed pair
+        cached = _today_cache = (ordinal, today.isoformat())
+    return cached[1]
+
+
+def _is_officer(person):
+    """Return True if person is exactly an Officer.
+
+    Subclasses of Officer are not treated as officers. For any other
+    object this avoids the ABCMeta.__instancecheck__ call that isinstance()
+    falls back to once its exact-type fast path misses.
+    """
+    return type(person) is Officer
+
+
+def _require_officer(person, message):
+    """Raise AccessDeniedException with message unless person is exactly an Officer."""
+    if type(person) is not Officer:
+        raise AccessDeniedException(message)
+
+
 class MilitaryPersonnel(ABC):
     """Abstract base class representing military personnel."""
     
+    __slots__ = ("_id", "_name", "_rank", "_unit", "__security_clearance", "__performance_records",
+                 "_info_cache", "_duty_cache")
+    
     personnel_count = 0
+    _unit_changes = 0  # Successful unit assignments, used by CampManagementSystem's unit index
     
     def __init__(self, id, name, rank, unit):
         # Protected attributes (single underscore)
@@ -30,7 +81,11 @@ class MilitaryPersonnel(ABC):
         
         # Private attributes (double underscore)
         self.__security_clearance = 1
-        self.__performance_records = []
+        self.__performance_records = deque()  # Append-only history
+        
+        # Protected caches for display_info/perform_duty, each a (rank, unit, text) tuple
+        self._info_cache = None
+        self._duty_cache = None
         
         # Class variable to track instances
         MilitaryPersonnel.personnel_count += 1
@@ -55,8 +110,7 @@ class MilitaryPersonnel(ABC):
     @rank.setter
     def rank(self, value):
         # Example of data validation in setter
-        valid_ranks = ["Private", "Corporal", "Sergeant", "Lieutenant", "Captain", "Major", "Colonel", "General"]
-        if value in valid_ranks:
+        if value in _VALID_RANKS:
             self._rank = value
         else:
             raise InvalidDataException(f"Invalid rank: {value}")
@@ -70,6 +124,7 @@ class MilitaryPersonnel(ABC):
         # Data validation for unit name
         if len(value) >= 3:  # Unit name must be at least 3 characters
             self._unit = value
+            MilitaryPersonnel._unit_changes += 1  # Tells unit indexes to rebuild on their next lookup
         else:
             raise InvalidDataException(f"Invalid unit name: {value}")
     
@@ -81,17 +136,18 @@ class MilitaryPersonnel(ABC):
     # Setter for security clearance using tuple format (for test compatibility)
     @security_clearance.setter
     def security_clearance(self, args):
-        if isinstance(args, tuple) and len(args) == 2:
-            new_level, authorizing_officer = args
-            self.update_security_clearance(new_level, authorizing_officer)
-        else:
+        if type(args) is not tuple:
             raise InvalidDataException("Invalid arguments for security clearance")
+        try:
+            new_level, authorizing_officer = args
+        except ValueError:  # Wrong number of items
+            raise InvalidDataException("Invalid arguments for security clearance") from None
+        self.update_security_clearance(new_level, authorizing_officer)
     
     # Method to update security clearance with validation
     def update_security_clearance(self, new_level, authorizing_officer):
         # Simple authorization check
-        if not isinstance(authorizing_officer, Officer):
-            raise AccessDeniedException("Security clearance can only be updated by an Officer")
+        _require_officer(authorizing_officer, "Security clearance can only be updated by an Officer")
         
         # Data validation
         if 1 <= new_level <= 5:
@@ -102,12 +158,11 @@ class MilitaryPersonnel(ABC):
     # Methods to access and modify private data with authorization
     def add_performance_record(self, record, evaluator):
         # Simple authorization check
-        if not isinstance(evaluator, Officer):
-            raise AccessDeniedException("Only officers can add performance records")
+        _require_officer(evaluator, "Only officers can add performance records")
             
         # Create and store the record
         record_entry = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": _today_str(),
             "evaluator": f"{evaluator.rank} {evaluator.name}",
             "content": record
         }
@@ -116,16 +171,16 @@ class MilitaryPersonnel(ABC):
     # Two method names for test compatibility
     def get_performance_records(self, requestor):
         # Same implementation as get_performance_history for compatibility
-        if requestor.id == self.id or isinstance(requestor, Officer):
-            return self.__performance_records.copy()
+        if requestor is self or _is_officer(requestor) or requestor.id == self.id:
+            return [*self.__performance_records]
         else:
             raise AccessDeniedException("Not authorized to view performance records")
     
     def get_performance_history(self, requestor):
-        # Authorization check - self or officer can access
-        if requestor.id == self.id or isinstance(requestor, Officer):
+        # Authorization check - self or officer can access (cheapest test first)
+        if requestor is self or _is_officer(requestor) or requestor.id == self.id:
             # Return a copy to maintain encapsulation
-            return self.__performance_records.copy()
+            return [*self.__performance_records]
         else:
             raise AccessDeniedException("Not authorized to view performance records")
     
@@ -143,13 +198,16 @@ class MilitaryPersonnel(ABC):
 class Officer(MilitaryPersonnel):
     """Class representing officers in the military."""
     
+    # __dict__ stays available so callers can attach ad-hoc attributes to officers
+    __slots__ = ("_specialization", "__command_code", "__dict__")
+    
     def __init__(self, id, name, rank, unit, specialization):
         # Call parent constructor
         super().__init__(id, name, rank, unit)
         
         # Add officer-specific attributes
         self._specialization = specialization                # Protected attribute
-        self.__command_code = f"CMD-{id}-{hash(name)%1000}"  # Private attribute - highly sensitive
+        self.__command_code = _CMD_PREFIX + str(id) + "-" + str(hash(name) % 1000)  # Private attribute - highly sensitive
     
     @property
     def specialization(self):
@@ -161,23 +219,35 @@ class Officer(MilitaryPersonnel):
         return "RESTRICTED ACCESS"
     
     def display_info(self):
-        # Example of controlled information disclosure
-        return f"ID: {self._id} | Name: {self._name} | Rank: {self._rank} | Unit: {self._unit} | Specialization: {self._specialization}"
+        # Example of controlled information disclosure (reused while rank and unit are unchanged)
+        cached = self._info_cache
+        if cached is not None and cached[0] is self._rank and cached[1] is self._unit:
+            return cached[2]
+        info = f"ID: {self._id} | Name: {self._name} | Rank: {self._rank} | Unit: {self._unit} | Specialization: {self._specialization}"
+        self._info_cache = (self._rank, self._unit, info)
+        return info
     
     def perform_duty(self):
-        return f"{self._rank} {self._name} is commanding {self._unit}"
+        cached = self._duty_cache
+        if cached is not None and cached[0] is self._rank and cached[1] is self._unit:
+            return cached[2]
+        duty = f"{self._rank} {self._name} is commanding {self._unit}"
+        self._duty_cache = (self._rank, self._unit, duty)
+        return duty
 
 
 class Recruit(MilitaryPersonnel):
     """Class representing recruits in the military."""
     
+    __slots__ = ("__training_scores", "__disciplinary_record", "_aptitude_ratings")
+    
     def __init__(self, id, name, unit):
         # Call parent constructor with fixed rank
         super().__init__(id, name, "Private", unit)
         
         # Add recruit-specific attributes
         self.__training_scores = {}      # Private attribute
-        self.__disciplinary_record = []  # Private attribute
+        self.__disciplinary_record = deque()  # Private attribute - append-only history
         self._aptitude_ratings = {       # Protected attribute
             "leadership": 0, 
             "technical": 0, 
@@ -199,8 +269,7 @@ class Recruit(MilitaryPersonnel):
     
     def update_training_score(self, training_type, score, instructor):
         # Simple authorization check
-        if not isinstance(instructor, Officer):
-            raise AccessDeniedException("Only officers can update training scores")
+        _require_officer(instructor, "Only officers can update training scores")
             
         # Data validation
         if 0 <= score <= 100:
@@ -210,7 +279,7 @@ class Recruit(MilitaryPersonnel):
     
     def get_training_scores(self, requestor):
         # Role-based access control
-        if requestor.id == self.id or isinstance(requestor, Officer):
+        if requestor is self or _is_officer(requestor) or requestor.id == self.id:
             # Return a copy to maintain encapsulation
             return self.__training_scores.copy()
         else:
@@ -218,28 +287,39 @@ class Recruit(MilitaryPersonnel):
     
     def add_disciplinary_action(self, action, officer):
         # Authorization check
-        if not isinstance(officer, Officer):
-            raise AccessDeniedException("Only officers can add disciplinary actions")
+        _require_officer(officer, "Only officers can add disciplinary actions")
         
         # Create and store the record
         action_record = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": _today_str(),
             "officer": f"{officer.rank} {officer.name}",
             "action": action
         }
         self.__disciplinary_record.append(action_record)
     
     def display_info(self):
-        # Only show basic information
-        return f"ID: {self._id} | Name: {self._name} | Rank: {self._rank} | Unit: {self._unit}"
+        # Only show basic information (reused while rank and unit are unchanged)
+        cached = self._info_cache
+        if cached is not None and cached[0] is self._rank and cached[1] is self._unit:
+            return cached[2]
+        info = f"ID: {self._id} | Name: {self._name} | Rank: {self._rank} | Unit: {self._unit}"
+        self._info_cache = (self._rank, self._unit, info)
+        return info
     
     def perform_duty(self):
-        return f"{self._name} is training at {self._unit}"
+        cached = self._duty_cache
+        if cached is not None and cached[0] is self._rank and cached[1] is self._unit:
+            return cached[2]
+        duty = f"{self._name} is training at {self._unit}"
+        self._duty_cache = (self._rank, self._unit, duty)
+        return duty
 
 
 class TrainingProgram:
     """Class representing a training program in the military camp."""
     
+    __slots__ = ("__program_code", "_name", "_duration", "__performance_metrics", "_requirements")
+    
     def __init__(self, code, name, duration):
         self.__program_code = code        # Private attribute
         self._name = name                 # Protected attribute
@@ -266,22 +346,19 @@ class TrainingProgram:
     
     def add_requirement(self, requirement, authorizer):
         # Authorization check
-        if not isinstance(authorizer, Officer):
-            raise AccessDeniedException("Only officers can add requirements")
+        _require_officer(authorizer, "Only officers can add requirements")
         
         self._requirements.append(requirement)
     
     def add_performance_metric(self, metric_name, threshold, authorizer):
         # Authorization check
-        if not isinstance(authorizer, Officer):
-            raise AccessDeniedException("Only officers can add performance metrics")
+        _require_officer(authorizer, "Only officers can add performance metrics")
         
         self.__performance_metrics[metric_name] = threshold
     
     def get_performance_metrics(self, requestor):
         # Authorization check
-        if not isinstance(requestor, Officer):
-            raise AccessDeniedException("Only officers can view performance metrics")
+        _require_officer(requestor, "Only officers can view performance metrics")
         
         # Return a copy to maintain encapsulation
         return self.__performance_metrics.copy()
@@ -290,60 +367,88 @@ class TrainingProgram:
 class EquipmentInventory:
     """Class representing the equipment inventory in the military camp."""
     
+    __slots__ = ("__equipment", "__by_assignee", "__by_status")
+    
     def __init__(self):
-        self.__equipment = {}  # Private attribute - {id: {details}}
+        self.__equipment = {}  # Private attribute - {id: (details, public view)}
+        
+        # Private secondary indexes kept in step with __equipment
+        self.__by_assignee = {}  # {person_id: {equipment_id, ...}}
+        self.__by_status = {"Available": set(), "Assigned": set()}  # {status: {equipment_id, ...}}
     
     def add_equipment(self, equipment_id, name, category, authorizer):
         # Authorization check
-        if not isinstance(authorizer, Officer):
-            raise AccessDeniedException("Only officers can add equipment")
+        _require_officer(authorizer, "Only officers can add equipment")
         
         # Check for duplicates
         if equipment_id in self.__equipment:
             return False
         
-        # Create equipment record
-        self.__equipment[equipment_id] = {
+        # Create equipment record, plus the limited view shown to non-officers
+        details = {
             "id": equipment_id,
             "name": name,
             "category": category,
-            "serial": f"SN-{hash(equipment_id)%10000}",
+            "serial": "SN-%d" % (hash(equipment_id) % 10000),
             "status": "Available",
             "assigned_to": None,
             "maintenance": []
         }
+        public = {
+            "id": equipment_id,
+            "name": name,
+            "category": category,
+            "status": "Available"
+        }
+        self.__equipment[equipment_id] = (details, public)
+        self.__by_status["Available"].add(equipment_id)
         return True
     
     def assign_equipment(self, equipment_id, person, authorizer):
         # Authorization check
-        if not isinstance(authorizer, Officer):
-            raise AccessDeniedException("Only officers can assign equipment")
+        _require_officer(authorizer, "Only officers can assign equipment")
         
         # Validate equipment exists
-        if equipment_id not in self.__equipment:
+        entry = self.__equipment.get(equipment_id)
+        if entry is None:
             raise InvalidDataException(f"Equipment ID {equipment_id} not found")
         
-        # Update assignment
-        self.__equipment[equipment_id]["assigned_to"] = person.id
-        self.__equipment[equipment_id]["status"] = "Assigned"
+        details, public = entry
+        
+        # Drop the previous assignment from the indexes
+        previous = details["assigned_to"]
+        if previous is not None:
+            assigned = self.__by_assignee[previous]
+            assigned.discard(equipment_id)
+            if not assigned:
+                del self.__by_assignee[previous]
+        self.__by_status[details["status"]].discard(equipment_id)
+        
+        # Update assignment (status appears in both views)
+        details["assigned_to"] = person.id
+        details["status"] = public["status"] = "Assigned"
+        self.__by_assignee.setdefault(person.id, set()).add(equipment_id)
+        self.__by_status["Assigned"].add(equipment_id)
         return True
     
     def log_maintenance(self, equipment_id, note, authorizer):
         # Authorization check
-        if not authorizer or not isinstance(authorizer, Officer):
-            raise AccessDeniedException("Only officers can log maintenance")
+        _require_officer(authorizer, "Only officers can log maintenance")
         
         # Validate equipment exists
-        if equipment_id not in self.__equipment:
+        entry = self.__equipment.get(equipment_id)
+        if entry is None:
             raise InvalidDataException(f"Equipment ID {equipment_id} not found")
         
+        details, public = entry
+        
         # Add maintenance record
         record = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": _today_str(),
             "officer": f"{authorizer.rank} {authorizer.name}",
             "note": note
         }
-        self.__equipment[equipment_id]["maintenance"].append(record)
+        details["maintenance"].append(record)
         return True
     
     def get_equipment_details(self, equipment_id, requestor):
@@ -352,35 +457,53 @@ class EquipmentInventory:
             raise AccessDeniedException("Authentication required to access equipment details")
         
         # Validate equipment exists
-        if equipment_id not in self.__equipment:
+        entry = self.__equipment.get(equipment_id)
+        if entry is None:
             raise InvalidDataException(f"Equipment ID {equipment_id} not found")
         
-        equipment = self.__equipment[equipment_id]
+        details, public = entry
         
         # Role-based information disclosure
-        if isinstance(requestor, Officer):
+        if _is_officer(requestor):
             # Officers see full details
-            return equipment.copy()
+            return details.copy()
         else:
             # Recruits see limited information
-            return {
-                "id": equipment["id"],
-                "name": equipment["name"],
-                "category": equipment["category"],
-                "status": equipment["status"]
-            }
+            return public.copy()
+    
+    def get_equipment_by_assignee(self, person_id, requestor):
+        # Authorization check - self or officer can access
+        if requestor is None:
+            raise AccessDeniedException("Authentication required to access equipment assignments")
+        if not _is_officer(requestor) and requestor.id != person_id:
+            raise AccessDeniedException("Not authorized to view equipment assignments")
+        
+        # Return a copy to maintain encapsulation
+        return {*self.__by_assignee.get(person_id, ())}
+    
+    def get_equipment_by_status(self, status, requestor):
+        # Authorization check
+        _require_officer(requestor, "Only officers can view equipment by status")
+        
+        # Return a copy to maintain encapsulation
+        return {*self.__by_status.get(status, ())}
 
 
 class CampManagementSystem:
     """Class representing the military camp management system."""
     
+    __slots__ = ("__name", "__location", "__personnel", "__training_programs",
+                 "__equipment_inventory", "__id_counters", "__by_unit", "__by_unit_changes")
+    
     def __init__(self, name, location):
         self.__name = name                # Private attribute
         self.__location = location        # Private attribute
-        self.__personnel = []             # Private attribute
-        self.__training_programs = []     # Private attribute
+        self.__personnel = {}             # Private attribute - {id: person}
+        self.__training_programs = {}     # Private attribute - {code: program}
         self.__equipment_inventory = EquipmentInventory()  # Private attribute
-        self.__next_id = 1                # Private attribute
+        self.__id_counters = defaultdict(lambda: count(1))  # Private attribute - {role_prefix: counter}
+        self.__by_unit = {}               # Private attribute - {unit: [person, ...]}
+        self.__by_unit_changes = MilitaryPersonnel._unit_changes  # Transfer count the index reflects
     
     @property
     def name(self):
@@ -393,59 +516,76 @@ class CampManagementSystem:
     @property
     def personnel(self):
         # Return a copy to maintain encapsulation
-        return self.__personnel.copy()
+        return [*self.__personnel.values()]
     
     @property
     def training_programs(self):
         # Return a copy to maintain encapsulation
-        return self.__training_programs.copy()
+        return [*self.__training_programs.values()]
     
     def get_next_id(self, role_prefix):
-        id_val = self.__next_id
-        self.__next_id += 1
-        return f"{role_prefix}{id_val:03d}"
+        # Each role prefix numbers its own IDs from 001
+        return role_prefix + str(next(self.__id_counters[role_prefix])).zfill(3)
     
     def add_personnel(self, person, authorizer):
         # Authorization check
-        if not isinstance(authorizer, Officer):
-            raise AccessDeniedException("Only officers can add personnel")
+        _require_officer(authorizer, "Only officers can add personnel")
         
+        return self.__register(person)
+    
+    def add_personnel_bulk(self, people, authorizer):
+        # Authorization check (once for the whole batch)
+        _require_officer(authorizer, "Only officers can add personnel")
+        
+        register = self.__register
+        return [register(person) for person in people]
+    
+    def __register(self, person):
         # Check if person already exists
-        if any(p.id == person.id for p in self.__personnel):
+        person_id = person.id
+        if person_id in self.__personnel:
             return False
         
-        self.__personnel.append(person)
+        self.__personnel[person_id] = person
+        self.__by_unit.setdefault(person.unit, []).append(person)
         return True
     
+    def __rebuild_unit_index(self):
+        # Regroup members by their current unit after a transfer
+        by_unit = {}
+        for person in self.__personnel.values():
+            by_unit.setdefault(person.unit, []).append(person)
+        self.__by_unit = by_unit
+        self.__by_unit_changes = MilitaryPersonnel._unit_changes
+    
     def find_personnel_by_id(self, person_id, requestor):
         # Authorization check
         if requestor is None:
             raise AccessDeniedException("Authentication required to access personnel records")
         
-        # Search for the person
-        for person in self.__personnel:
-            if person.id == person_id:
-                return person
-        return None
+        # Look up the person by ID
+        return self.__personnel.get(person_id)
     
     def get_personnel_by_unit(self, unit, requestor):
         # Authorization check
-        if not isinstance(requestor, Officer):
-            raise AccessDeniedException("Only officers can view unit personnel")
+        _require_officer(requestor, "Only officers can view unit personnel")
+        
+        # Rebuild the index if anyone changed unit since it was built
+        if self.__by_unit_changes != MilitaryPersonnel._unit_changes:
+            self.__rebuild_unit_index()
         
-        # Filter personnel by unit
-        return [p for p in self.__personnel if p.unit == unit]
+        # Return a copy of the unit's members to maintain encapsulation
+        return [*self.__by_unit.get(unit, ())]
     
     def add_training_program(self, program, authorizer):
         # Authorization check
-        if not isinstance(authorizer, Officer):
-            raise AccessDeniedException("Only officers can add training programs")
+        _require_officer(authorizer, "Only officers can add training programs")
         
         # Check if program already exists
-        if any(p.code == program.code for p in self.__training_programs):
+        if program.code in self.__training_programs:
             return False
         
-        self.__training_programs.append(program)
+        self.__training_programs[program.code] = program
         return True
     
     def get_equipment_inventory(self):
@@ -14,18 +14,12 @@ class TestExceptional:
             commander = Officer("O001", "Emma Smith", "Colonel", "Alpha Battalion", "Infantry")
             
             # Test invalid rank assignment
-            try:
+            with pytest.raises(InvalidDataException, match="Invalid rank"):
                 commander.rank = "Invalid Rank"
-                assert False, "Should raise InvalidDataException"
-            except InvalidDataException:
-                pass  # Expected behavior
             
             # Test unit validation
-            try:
+            with pytest.raises(InvalidDataException, match="Invalid unit name"):
                 commander.unit = "AB"  # Too short
-                assert False, "Should raise InvalidDataException"
-            except InvalidDataException:
-                pass  # Expected behavior
             
             # Test security clearance validation
             superior = Officer("O002", "James Moore", "General", "Command HQ", "Leadership")
@@ -36,19 +30,17 @@ class TestExceptional:
             assert commander.security_clearance == 3
             
             # Invalid clearance level
-            try:
+            with pytest.raises(InvalidDataException, match="between 1 and 5"):
                 commander.update_security_clearance(10, superior)  # Invalid level
-                assert False, "Should raise InvalidDataException"
-            except InvalidDataException:
-                pass  # Expected behavior
+            
+            # Malformed setter arguments are rejected as invalid data
+            with pytest.raises(InvalidDataException, match="Invalid arguments for security clearance"):
+                commander.security_clearance = "ab"  # Two items, but not a (level, officer) tuple
             
             # Unauthorized clearance change
             recruit = Recruit("R001", "John Davis", "Alpha Battalion")
-            try:
+            with pytest.raises(AccessDeniedException, match="only be updated by an Officer"):
                 commander.update_security_clearance(4, recruit)  # Recruit can't change clearance
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test Recruit exceptions
             
@@ -57,18 +49,12 @@ class TestExceptional:
             recruit.update_training_score("marksmanship", 85, instructor)
             
             # Test updating training scores without authorization
-            try:
+            with pytest.raises(AccessDeniedException, match="update training scores"):
                 recruit.update_training_score("physical", 90, None)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test score validation
-            try:
+            with pytest.raises(InvalidDataException, match="between 0 and 100"):
                 recruit.update_training_score("physical", 110, instructor)  # Invalid score
-                assert False, "Should raise InvalidDataException"
-            except InvalidDataException:
-                pass  # Expected behavior
             
             # Test training score access authorization
             scores = recruit.get_training_scores(recruit)  # Self access
@@ -79,21 +65,15 @@ class TestExceptional:
             
             # Test unauthorized access
             other_recruit = Recruit("R002", "Sarah Johnson", "Bravo Battalion")
-            try:
+            with pytest.raises(AccessDeniedException, match="view training scores"):
                 recruit.get_training_scores(other_recruit)  # Another recruit can't access
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test disciplinary action authorization
             recruit.add_disciplinary_action("Late for formation", commander)
             
             # Test unauthorized disciplinary action
-            try:
+            with pytest.raises(AccessDeniedException, match="disciplinary actions"):
                 recruit.add_disciplinary_action("Unauthorized report", other_recruit)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test TrainingProgram exceptions
             program = TrainingProgram("TP001", "Basic Combat Training", "8 weeks")
@@ -102,32 +82,23 @@ class TestExceptional:
             program.add_requirement("Physical fitness test", commander)
             
             # Test unauthorized requirement addition
-            try:
+            with pytest.raises(AccessDeniedException, match="add requirements"):
                 program.add_requirement("Unauthorized requirement", recruit)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test performance metric addition with proper authorization
             program.add_performance_metric("run_time", 15, commander)
             
             # Test unauthorized performance metric addition
-            try:
+            with pytest.raises(AccessDeniedException, match="add performance metrics"):
                 program.add_performance_metric("unauthorized_metric", 10, recruit)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test performance metric access with proper authorization
             metrics = program.get_performance_metrics(commander)
             assert "run_time" in metrics
             
             # Test unauthorized performance metric access
-            try:
+            with pytest.raises(AccessDeniedException, match="view performance metrics"):
                 program.get_performance_metrics(None)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test EquipmentInventory exceptions
             inventory = EquipmentInventory()
@@ -136,38 +107,26 @@ class TestExceptional:
             inventory.add_equipment("E001", "M4 Rifle", "Weapon", commander)
             
             # Test unauthorized equipment addition
-            try:
+            with pytest.raises(AccessDeniedException, match="add equipment"):
                 inventory.add_equipment("E002", "Combat Vest", "Gear", recruit)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test equipment assignment with proper authorization
             inventory.assign_equipment("E001", recruit, commander)
             
             # Test equipment assignment to non-existent equipment
-            try:
+            with pytest.raises(InvalidDataException, match="NONEXISTENT not found"):
                 inventory.assign_equipment("NONEXISTENT", recruit, commander)
-                assert False, "Should raise InvalidDataException"
-            except InvalidDataException:
-                pass  # Expected behavior
             
             # Test equipment assignment unauthorized
-            try:
+            with pytest.raises(AccessDeniedException, match="assign equipment"):
                 inventory.assign_equipment("E001", commander, recruit)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test maintenance logging with proper authorization
             inventory.log_maintenance("E001", "Regular cleaning", commander)
             
             # Test unauthorized maintenance logging
-            try:
+            with pytest.raises(AccessDeniedException, match="log maintenance"):
                 inventory.log_maintenance("E001", "Unauthorized note", None)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test equipment details with different authorization levels
             officer_view = inventory.get_equipment_details("E001", commander)
@@ -179,18 +138,12 @@ class TestExceptional:
             assert "maintenance" not in recruit_view
             
             # Test equipment detail access to non-existent equipment
-            try:
+            with pytest.raises(InvalidDataException, match="NONEXISTENT not found"):
                 inventory.get_equipment_details("NONEXISTENT", commander)
-                assert False, "Should raise InvalidDataException"
-            except InvalidDataException:
-                pass  # Expected behavior
             
             # Test equipment detail access without authorization
-            try:
+            with pytest.raises(AccessDeniedException, match="Authentication required"):
                 inventory.get_equipment_details("E001", None)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # CampManagementSystem exceptions
             camp = CampManagementSystem("Alpha Training Camp", "Fort Benning")
@@ -210,22 +163,16 @@ class TestExceptional:
             assert camp.find_personnel_by_id("NONEXISTENT", commander) is None
             
             # Test finding personnel without authorization
-            try:
+            with pytest.raises(AccessDeniedException, match="Authentication required"):
                 camp.find_personnel_by_id("O001", None)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test unit personnel retrieval with proper authorization
             unit_personnel = camp.get_personnel_by_unit("Alpha Battalion", commander)
             assert len(unit_personnel) == 2
             
             # Test unit personnel retrieval without authorization
-            try:
+            with pytest.raises(AccessDeniedException, match="view unit personnel"):
                 camp.get_personnel_by_unit("Alpha Battalion", recruit)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             # Test immutability of collections
             personnel_copy = camp.personnel
@@ -242,13 +189,10 @@ class TestExceptional:
             assert camp.add_training_program(new_program, commander) is True
             
             # Test training program addition without authorization
-            try:
+            with pytest.raises(AccessDeniedException, match="add training programs"):
                 camp.add_training_program(new_program, recruit)
-                assert False, "Should raise AccessDeniedException"
-            except AccessDeniedException:
-                pass  # Expected behavior
             
             TestUtils.yakshaAssert("test_exception_handling", True, "exceptional")
-        except Exception as e:
+        except (Exception, pytest.fail.Exception) as e:
             TestUtils.yakshaAssert("test_exception_handling", False, "exceptional")
             raise e
\ No newline at end of file